@@ -14,15 +14,45 @@ should return the number, from the doors list, of the selected door.
 Two standard strategies are implemented here, the always swap stategy
 (optimum solution for the classical problem) and the never swap
 strategy.
+
+Custom experiment functions, given to `MontyHallExperiment`, receive
+the correct door as a Door. The default `experiment` function also
+accepts the index of the correct door, which is how it is called
+internally.
+
+A strategy can also provide a vectorized form as its `vectorized`
+attribute, which is used to run a whole batch of simulations at once
+using NumPy. This should be a function that takes a boolean array of
+shape (number, N) marking the doors that remain in each simulation and
+an integer array containing the index of the most recent selection in
+each simulation, and returns an integer array of new selections. If
+Numba is installed, the standard strategies are run using a compiled
+form of the experiment instead.
 """
-import random
 import functools
-import inspect
+import itertools
+import multiprocessing
+import os
+import pickle
+import random
 import time
 from collections import namedtuple
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from itertools import accumulate
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import loky
+except ImportError:
+    loky = None
+
 __all__ = [
     "Door", 
     "MontyHallExperiment", 
@@ -37,15 +67,21 @@ MontyHallResult = namedtuple("MontyHallResult", ("success", "correct", "choices"
 
 DOOR_COUNT = 0
 
+# Tolerance allowed when checking that door probabilities sum to at most 1.
+_PROBABILITY_TOLERANCE = 1e-9
+
 
 class Door:
     """
     Door for use in a Monty Hall experiment.
 
     Each door can be given an custom probability if this differs from
-    the classical case of equal probabilities.
+    the classical case of equal probabilities. Doors are compared and
+    hashed by their label.
     """
 
+    __slots__ = ("label", "probability")
+
     def __init__(self, probability=None, label=None):
         if probability is not None:
             assert 0 < probability < 1, "Probability must be between 0 and 1"
@@ -67,6 +103,48 @@ class Door:
             return self.label == other.label
         return NotImplemented
 
+    def __hash__(self):
+        return hash(self.label)
+
+
+# Random number generators used outside of the compiled experiment. The
+# NumPy generator draws whole batches at once, while the Python one makes
+# the single choices in `experiment`, where it is much faster per call.
+# Each worker process reseeds both when it starts.
+_RNG = np.random.default_rng()
+_RANDOM = random.Random()
+
+# Number of simulations run together by the vectorized form of a
+# strategy. This bounds the size of the arrays used for each batch.
+_VECTOR_BATCH_SIZE = 65536
+
+# Source of the tokens that identify each experiment to its workers.
+_EXPERIMENT_TOKENS = itertools.count()
+
+# Default choice function, choosing an element of a sequence at random.
+_choice = _RANDOM.choice
+
+
+def _is_default_choice(choice_func):
+    """
+    Determine whether the choice function is the default, or
+    `random.choice`, which was the default previously and is treated
+    as equivalent.
+    """
+    return choice_func is _choice or choice_func is random.choice
+
+
+def _init_rng():
+    """
+    Reseed the random number generators for this process.
+
+    Worker processes created by forking would otherwise share the state
+    of the parent's generators, and so produce identical simulations.
+    """
+    global _RNG
+    _RNG = np.random.default_rng()
+    _RANDOM.seed()
+
 
 def experiment(doors, strategy, choice_func, correct):
     """
@@ -79,18 +157,294 @@ def experiment(doors, strategy, choice_func, correct):
 
     Once only two doors remain, the experiment returns True if the most
     recent selection was the correct door, and False otherwise.
+
+    The correct door can be given as a Door or by its index in the doors
+    list; `MontyHallExperiment` passes the index. Doors are tracked by
+    index throughout, so Door objects are only compared when the
+    strategy changes the selection.
     """
     door_indices = list(range(len(doors)))
-    selections = [random.choice(doors)]
+    if isinstance(correct, Door):
+        correct_index = doors.index(correct)
+    else:
+        correct_index = correct
+    selected_index = _choice(door_indices)
+    selections = [doors[selected_index]]
+
+    # Doors that the host may reveal, updated as doors are revealed and
+    # selections change rather than rebuilt at each step.
+    eliminable = set(door_indices)
+    eliminable.discard(correct_index)
+    eliminable.discard(selected_index)
     while len(door_indices) > 2:
-        elim = choice_func([i for i in door_indices 
-                            if not doors[i] in (correct, selections[-1])])
+        elim = choice_func(sorted(eliminable))
         door_indices.remove(elim)
-        selections.append(
-            strategy([doors[i] for i in door_indices], selections)
-        )
-    return MontyHallResult(selections[-1] == correct, correct, selections)
-        
+        eliminable.discard(elim)
+        selection = strategy([doors[i] for i in door_indices], selections)
+        if selection is not selections[-1]:
+            new_index = doors.index(selection)
+            if new_index != selected_index:
+                if selected_index != correct_index:
+                    eliminable.add(selected_index)
+                eliminable.discard(new_index)
+                selected_index = new_index
+        selections.append(selection)
+    return MontyHallResult(
+        selected_index == correct_index, doors[correct_index], selections
+    )
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _draw_correct_nb(cum_weights):
+        """
+        Draw the index of the correct door in a compiled kernel.
+        """
+        return np.searchsorted(cum_weights, np.random.random(), side="right")
+
+    @numba.njit(cache=True)
+    def _reveal_nb(remaining, count, correct, current, eligible):
+        """
+        Reveal one of the first `count` remaining doors that is neither
+        correct nor currently selected, and return the new count.
+
+        The remaining doors are kept in order, so that always swap picks
+        the same door as the Python strategy.
+        """
+        eligible_count = 0
+        for i in range(count):
+            door = remaining[i]
+            if door != correct and door != current:
+                eligible[eligible_count] = door
+                eligible_count += 1
+        elim = eligible[np.random.randint(0, eligible_count)]
+
+        count -= 1
+        shift = False
+        for i in range(count):
+            if remaining[i] == elim:
+                shift = True
+            if shift:
+                remaining[i] = remaining[i + 1]
+        return count
+
+    @numba.njit(cache=True)
+    def _always_swap_experiment_nb(number_of_doors, correct):
+        """
+        Compiled form of `experiment` specialised to the always swap
+        strategy. Returns True if the final selection is correct.
+        """
+        remaining = np.arange(number_of_doors)
+        eligible = np.empty(number_of_doors, np.int64)
+        count = number_of_doors
+        current = np.random.randint(0, number_of_doors)
+        while count > 2:
+            count = _reveal_nb(remaining, count, correct, current, eligible)
+            for i in range(count):
+                if remaining[i] != current:
+                    current = remaining[i]
+                    break
+        return current == correct
+
+    # Constants for the bitmask form of the experiment. These must be
+    # unsigned, since mixing uint64 and int64 in Numba gives a float.
+    _ONE = np.uint64(1)
+    _ALL_DOORS = np.uint64(0xFFFFFFFFFFFFFFFF)
+    _BYTE = np.uint64(0xFF)
+    _M1 = np.uint64(0x5555555555555555)
+    _M2 = np.uint64(0x3333333333333333)
+    _M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+    _H01 = np.uint64(0x0101010101010101)
+
+    @numba.njit(cache=True)
+    def _popcount_nb(x):
+        """
+        Count the set bits of a uint64, using parallel bit counting.
+        """
+        x = x - ((x >> np.uint64(1)) & _M1)
+        x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+        x = (x + (x >> np.uint64(4))) & _M4
+        return np.int64((x * _H01) >> np.uint64(56))
+
+    @numba.njit(cache=True)
+    def _lowest_bit_nb(x):
+        """
+        Return the position of the lowest set bit of a non-zero uint64.
+        """
+        return _popcount_nb((x & (~x + _ONE)) - _ONE)
+
+    @numba.njit(cache=True)
+    def _select_bit_nb(x, k):
+        """
+        Return the position of the k-th lowest set bit of a uint64.
+
+        Whole bytes are skipped using their bit counts before clearing
+        the lower set bits of the byte that contains the k-th set bit.
+        """
+        shift = 0
+        count = _popcount_nb(x & _BYTE)
+        while k >= count:
+            k -= count
+            x >>= np.uint64(8)
+            shift += 8
+            count = _popcount_nb(x & _BYTE)
+        for _ in range(k):
+            x &= x - _ONE
+        return shift + _lowest_bit_nb(x)
+
+    @numba.njit(cache=True)
+    def _always_swap_bitmask_nb(number_of_doors, correct):
+        """
+        Bitmask form of `_always_swap_experiment_nb` for at most 64
+        doors.
+
+        The remaining doors are held as the set bits of a single uint64,
+        so revealing and selecting doors need no arrays.
+        """
+        if number_of_doors == 64:
+            remaining = _ALL_DOORS
+        else:
+            remaining = (_ONE << np.uint64(number_of_doors)) - _ONE
+        correct_bit = _ONE << np.uint64(correct)
+        current = np.random.randint(0, number_of_doors)
+        for _ in range(number_of_doors - 2):
+            current_bit = _ONE << np.uint64(current)
+            eligible = remaining & ~(correct_bit | current_bit)
+            k = np.random.randint(0, _popcount_nb(eligible))
+            remaining &= ~(_ONE << np.uint64(_select_bit_nb(eligible, k)))
+            current = _lowest_bit_nb(remaining & ~current_bit)
+        return current == correct
+
+    @numba.njit(parallel=True, cache=True)
+    def _always_swap_kernel_nb(cum_weights, number):
+        """
+        Run the number of simulations of the always swap strategy in
+        parallel threads and return the number of successes.
+        """
+        number_of_doors = cum_weights.shape[0]
+        successes = 0
+        if number_of_doors <= 64:
+            for _ in numba.prange(number):
+                correct = _draw_correct_nb(cum_weights)
+                if _always_swap_bitmask_nb(number_of_doors, correct):
+                    successes += 1
+        else:
+            for _ in numba.prange(number):
+                correct = _draw_correct_nb(cum_weights)
+                if _always_swap_experiment_nb(number_of_doors, correct):
+                    successes += 1
+        return successes
+
+    @numba.njit(parallel=True, cache=True)
+    def _never_swap_kernel_nb(cum_weights, number):
+        """
+        Run the number of simulations of the never swap strategy in
+        parallel threads and return the number of successes.
+
+        The doors revealed by the host cannot change the selection, so
+        only the initial selection is drawn.
+        """
+        number_of_doors = cum_weights.shape[0]
+        successes = 0
+        for _ in numba.prange(number):
+            correct = _draw_correct_nb(cum_weights)
+            if np.random.randint(0, number_of_doors) == correct:
+                successes += 1
+        return successes
+
+
+def _run_with_door(experiment_func, doors, strategy, choice_func, correct):
+    """
+    Run a custom experiment function, passing it the correct door as a
+    Door rather than by its index.
+    """
+    return experiment_func(doors, strategy, choice_func, doors[correct])
+
+
+def _experiment_func(experiment_func, doors, strategy, choice_func):
+    """
+    Get a function that runs a single experiment given the index of the
+    correct door.
+
+    The default `experiment` takes the index directly. Custom experiment
+    functions are given the correct door as a Door, as they always have
+    been.
+    """
+    if experiment_func is experiment:
+        return functools.partial(experiment, doors, strategy, choice_func)
+    return functools.partial(
+        _run_with_door, experiment_func, doors, strategy, choice_func
+    )
+
+
+def _init_worker(doors, experiment, token=None):
+    """
+    Set up a worker process to run simulations for an experiment.
+
+    The doors and experiment function are stored when the worker starts,
+    so they are not sent with each task. The token is not used, but
+    identifies the experiment so that loky does not reuse workers set up
+    for another experiment whose doors compare equal.
+    """
+    global _WORKER_DOORS, _WORKER_EXPERIMENT
+    _init_rng()
+    _WORKER_DOORS = doors
+    _WORKER_EXPERIMENT = experiment
+
+
+def _run_worker_chunk(strategy, choice_func, correct_indices):
+    """
+    Run a chunk of simulations in a worker process set up by
+    `_init_worker` and return the number of successes.
+
+    A `choice_func` of None stands for the default choice function,
+    which uses this worker's own generator.
+    """
+    if choice_func is None:
+        choice_func = _choice
+    func = _experiment_func(
+        _WORKER_EXPERIMENT, _WORKER_DOORS, strategy, choice_func
+    )
+    return _run_chunk(func, correct_indices)
+
+
+def _mp_context():
+    """
+    Get the multiprocessing context used to start worker processes.
+
+    Forked workers inherit the doors rather than having them pickled,
+    so fork is used where it is available. Forking after the compiled
+    experiment has started TBB threads can deadlock, so the forkserver
+    is used instead in that case.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    if numba is not None:
+        try:
+            layer = numba.threading_layer()
+        except ValueError:
+            # No parallel kernel has been run yet.
+            layer = None
+        if layer == "tbb":
+            return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("fork")
+
+
+def _run_chunk(func, correct_indices):
+    """
+    Run the experiment for each of an array of correct door indices and
+    return the number of successes.
+
+    Worker processes are sent one chunk of indices per task, rather than
+    one index at a time.
+    """
+    successes = np.fromiter(
+        (func(correct).success for correct in correct_indices.tolist()),
+        dtype=np.bool_, count=len(correct_indices)
+    )
+    return int(np.count_nonzero(successes))
+
 
 class MontyHallExperiment:
     """
@@ -99,6 +453,13 @@ class MontyHallExperiment:
     The available doors can be specified individually when creating an
     experiment object, or by using the keyword-only number_of_doors
     parameter. 
+
+    A custom experiment function can be given using the keyword-only
+    experiment parameter. This is called in the same way as
+    `experiment`, with the list of doors, the strategy, the choice
+    function and the correct door, as a Door, and should return a
+    `MontyHallResult`. The choice function is given a list of door
+    indices and should return one of them.
     """
 
     def __init__(self, *doors, number_of_doors=None, experiment=experiment):
@@ -112,21 +473,102 @@ class MontyHallExperiment:
             doors = list(doors)
             number_of_doors = len(doors)
 
-        existing = sum(d.probability for d in doors 
-                       if d.probability is not None)
-        if not existing <= 1:
-            raise ValueError("existing probability sum to more than 1")
-            
-        prob = (1. - existing)/number_of_doors
-
+        existing = 0.
+        missing = []
         for door in doors:
             if door.probability is None:
+                missing.append(door)
+            else:
+                existing += door.probability
+        # Allow for rounding, since probabilities such as 1/9 do not
+        # sum to exactly 1 in floating point.
+        if existing > 1. + _PROBABILITY_TOLERANCE:
+            raise ValueError("existing probability sum to more than 1")
+
+        # The remaining probability is shared between the doors that
+        # were not given one.
+        if missing:
+            prob = max(0., 1. - existing)/len(missing)
+            for door in missing:
                 door.probability = prob
 
         self.doors = doors
+        cum_weights = np.fromiter(
+            accumulate(d.probability for d in doors),
+            dtype=np.float64, count=number_of_doors
+        )
+        cum_weights /= cum_weights[-1]
+        self._cum_weights = cum_weights
 
         self.experiment = experiment
 
+        self._pool = None
+        self._pool_max_workers = None
+        self._token = next(_EXPERIMENT_TOKENS)
+
+    def _get_pool(self, max_workers):
+        """
+        Get the pool of worker processes for this experiment, starting
+        it if necessary.
+
+        The pool is kept between calls to `run_simulations`, so worker
+        processes are only started once for each experiment. If loky is
+        installed, its reusable executor is used instead. This
+        is shared by all experiments, and its workers are restarted when
+        it is next asked for a different experiment.
+        """
+        if loky is not None:
+            return loky.get_reusable_executor(
+                max_workers=max_workers or os.cpu_count() or 1,
+                initializer=_init_worker,
+                initargs=(self.doors, self.experiment, self._token),
+            )
+        if self._pool is None or self._pool_max_workers != max_workers:
+            self.close()
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=_mp_context(),
+                initializer=_init_worker,
+                initargs=(self.doors, self.experiment),
+            )
+            self._pool_max_workers = max_workers
+        return self._pool
+
+    def close(self):
+        """
+        Shut down the worker processes used to run simulations, if they
+        have been started.
+
+        The loky executor used when loky is installed is shared between
+        experiments, and is left for loky to shut down.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_max_workers = None
+
+    def exact_probability(self, strategy):
+        """
+        Return the exact probability of success for the given strategy,
+        or None if no closed form is known.
+
+        The initial selection is made uniformly at random, independently
+        of the correct door, so the never swap strategy succeeds with
+        probability 1/N whatever the door probabilities. With three
+        doors, the always swap strategy succeeds precisely when the
+        initial selection is wrong, which happens with probability
+        (N-1)/N = 2/3. Closed forms are only used with the default
+        experiment function.
+        """
+        if self.experiment is not experiment:
+            return None
+        number_of_doors = len(self.doors)
+        if strategy is never_swap:
+            return 1. / number_of_doors
+        if strategy is always_swap and number_of_doors == 3:
+            return (number_of_doors - 1.) / number_of_doors
+        return None
+
     def get_correct_doors(self, number):
         """
         Generate the sequence of correct doors randomly according to
@@ -135,34 +577,215 @@ class MontyHallExperiment:
         This is a generator function.
         """
         doors = self.doors
-        cum_weights = list(accumulate(d.probability for d in doors))
-        for _ in range(number):
-            rand_no = random.random()
-            index = min(i for i, w in enumerate(cum_weights)
-                        if rand_no < w)
+        for index in self._draw_correct_indices(number):
             yield doors[index]
 
-    def run_simulations(self, strategy, number=1000, max_workers=None, choice_func=random.choice):
+    def _draw_correct_indices(self, number):
+        """
+        Draw the indices of the correct doors for the number of
+        simulations, according to the probability assigned to each
+        door.
+        """
+        return np.searchsorted(self._cum_weights, _RNG.random(number),
+                               side="right")
+
+    def _uses_defaults(self, choice_func):
+        """
+        Determine whether the default experiment and choice function
+        are in use, so the simulations can be run without calling them.
+        """
+        return (self.experiment is experiment
+                and _is_default_choice(choice_func))
+
+    def _is_three_door(self, strategy, choice_func):
+        """
+        Determine whether the simulations can be run using the fused
+        three door form of the standard strategies.
+        """
+        return (len(self.doors) == 3
+                and (strategy is always_swap or strategy is never_swap)
+                and self._uses_defaults(choice_func))
+
+    def _run_three_doors(self, strategy, number):
+        """
+        Run the number of simulations of a standard strategy on three
+        doors, and return the number of successes.
+
+        With three doors, the host reveals exactly one door, so always
+        swap succeeds precisely when the initial selection is wrong and
+        never swap when it is right. The whole experiment reduces to
+        comparing two arrays of random indices.
+        """
+        correct = self._draw_correct_indices(number)
+        initial = _RNG.integers(0, 3, size=number)
+        if strategy is always_swap:
+            return int(np.count_nonzero(initial != correct))
+        return int(np.count_nonzero(initial == correct))
+
+    def _is_compiled(self, strategy, choice_func):
+        """
+        Determine whether the simulations can be run using the compiled
+        form of the strategy.
+        """
+        return (strategy in _KERNEL_REGISTRY
+                and self._uses_defaults(choice_func))
+
+    def _is_vectorizable(self, strategy, choice_func):
+        """
+        Determine whether the simulations can be run using the
+        vectorized form of the strategy.
+        """
+        return (hasattr(strategy, "vectorized")
+                and self._uses_defaults(choice_func))
+
+    def _run_vectorized(self, strategy, number):
+        """
+        Run the number of simulations as a batch using NumPy, and
+        return the number of successes.
+
+        This follows the same steps as `experiment`, but each step is
+        applied to a whole batch of simulations at once. The simulations
+        are run in batches of at most `_VECTOR_BATCH_SIZE`, reusing the
+        same arrays, so memory use does not grow with `number`.
+        """
+        number_of_doors = len(self.doors)
+        batch_size = max(1, min(number, _VECTOR_BATCH_SIZE))
+        shape = (batch_size, number_of_doors)
+        keys_buffer = np.empty(shape)
+        remaining_buffer = np.empty(shape, dtype=bool)
+        revealed_buffer = np.empty(shape, dtype=bool)
+        all_rows = np.arange(batch_size)
+
+        successes = 0
+        for start in range(0, number, batch_size):
+            size = min(batch_size, number - start)
+            keys = keys_buffer[:size]
+            remaining = remaining_buffer[:size]
+            revealed = revealed_buffer[:size]
+            rows = all_rows[:size]
+
+            correct = self._draw_correct_indices(size)
+            current = _RNG.integers(0, number_of_doors, size=size)
+            remaining.fill(True)
+            for _ in range(number_of_doors - 2):
+                # The host reveals a door uniformly at random from those
+                # that remain and are neither correct nor selected.
+                _RNG.random(out=keys)
+                np.logical_not(remaining, out=revealed)
+                keys[revealed] = -1.
+                keys[rows, correct] = -1.
+                keys[rows, current] = -1.
+                remaining[rows, keys.argmax(axis=1)] = False
+                current = strategy.vectorized(remaining, current)
+            successes += int(np.count_nonzero(current == correct))
+        return successes
+
+    def _run_pool(self, strategy, choice_func, chunks, max_workers):
+        """
+        Run the chunks of simulations in the worker pool for this
+        experiment and return the number of successes.
+
+        Only the strategy, choice function and chunk are sent with each
+        task; the workers hold the doors and experiment function.
+        """
+        if _is_default_choice(choice_func):
+            # Pickling the bound method would send a copy of this
+            # process's generator state to every task.
+            choice_func = None
+        if loky is None:
+            # loky pickles tasks with cloudpickle, which also handles
+            # lambdas, so only the standard pool needs this check.
+            try:
+                pickle.dumps((strategy, choice_func))
+            except (pickle.PicklingError, AttributeError, TypeError) as exc:
+                raise TypeError(
+                    "strategy and choice_func must be picklable to run"
+                    " simulations in worker processes"
+                ) from exc
+        task = functools.partial(_run_worker_chunk, strategy, choice_func)
+        pool = self._get_pool(max_workers)
+        try:
+            return sum(pool.map(task, chunks))
+        except BrokenProcessPool:
+            self.close()
+            raise
+
+    def _run_experiments(self, strategy, number, max_workers, choice_func,
+                         parallel_threshold):
+        """
+        Run the number of simulations by calling the experiment function,
+        and return the number of successes.
+        """
+        correct_indices = self._draw_correct_indices(number)
+        if number < parallel_threshold:
+            func = _experiment_func(
+                self.experiment, self.doors, strategy, choice_func
+            )
+            return _run_chunk(func, correct_indices)
+
+        workers = max_workers or os.cpu_count() or 1
+        chunks = np.array_split(correct_indices, workers * 4)
+        return self._run_pool(strategy, choice_func, chunks, max_workers)
+
+    def run_simulations(self, strategy, number=1000, max_workers=None,
+                        choice_func=_choice, analytic=True,
+                        parallel_threshold=20_000, verbose=False):
         """
         Run the number of simulations.
 
+        If `analytic` is True (the default) and the probability of
+        success for the strategy is known exactly (see
+        `exact_probability`), then this value is returned without
+        running any simulations. Set `analytic` to False to force the
+        simulations to be run.
+
         Simulations are run concurrently in individual processes. For
-        this reason, the provided strategy must be a function and not a
-        lambda. The maximum numbers of worker processes can be 
-        controlled by the `max_workers` parameter. By default, this is
-        the number of cores of the host computer.
+        this reason, the provided strategy must be picklable, such as a
+        top-level function or a `functools.partial` of one, and not a
+        lambda or locally defined function. If loky is installed, the
+        simulations are distributed by its reusable executor instead, which
+        can also send lambdas to the workers. The maximum numbers of
+        worker processes can be controlled by the `max_workers`
+        parameter. By default, this is the number of cores of the host
+        computer. Starting the worker processes is expensive, so if
+        fewer than `parallel_threshold` simulations are to be run, they
+        are run in the current process instead. Once started, the worker
+        processes are reused by later calls, until `close` is called or,
+        with loky, until another experiment is run.
+
+        The `choice_func` is used by the host to choose which door to
+        reveal. The default, or `random.choice`, allows the simulations
+        for the standard strategies to be run without calling it, using
+        the faster compiled or vectorized forms. Any other choice
+        function is called for each door revealed.
+
+        If `verbose` is True, the time taken to run the simulations is
+        printed.
 
         Returns the proportion of experiments that were successful.
         """
-        start = time.time()
-        assert inspect.isfunction(strategy), "strategy must be a function"
-        func = functools.partial(
-            self.experiment, self.doors, strategy, choice_func
-        ) 
-        with ProcessPoolExecutor(max_workers=max_workers) as pool:
-            results = pool.map(func, self.get_correct_doors(number), chunksize=1000)
-            successes = sum(1 for r in results if r.success)
-        print(f"Ran {number} simulations in {time.time() - start} seconds")
+        if analytic:
+            exact = self.exact_probability(strategy)
+            if exact is not None:
+                return exact
+
+        if verbose:
+            start = time.perf_counter()
+        if self._is_three_door(strategy, choice_func):
+            successes = self._run_three_doors(strategy, number)
+        elif self._is_compiled(strategy, choice_func):
+            kernel = _KERNEL_REGISTRY[strategy]
+            successes = kernel(self._cum_weights, number)
+        elif self._is_vectorizable(strategy, choice_func):
+            successes = self._run_vectorized(strategy, number)
+        else:
+            successes = self._run_experiments(
+                strategy, number, max_workers, choice_func,
+                parallel_threshold
+            )
+        if verbose:
+            elapsed = time.perf_counter() - start
+            print(f"Ran {number} simulations in {elapsed} seconds")
         return successes / number
 
 
@@ -172,8 +795,10 @@ def always_swap(doors, past_selections):
 
     This is the optimum strategy for the classical Monty Hall problem.
     """
-    temp = [d for d in doors if not d == past_selections[-1]]
-    return temp[0]
+    last = past_selections[-1]
+    if len(doors) == 2:
+        return doors[0] if doors[0] != last else doors[1]
+    return next(d for d in doors if d != last)
 
 
 def never_swap(doors, past_selections):
@@ -183,4 +808,36 @@ def never_swap(doors, past_selections):
     return past_selections[-1]
 
 
+def _always_swap_vectorized(remaining, current):
+    """
+    Vectorized form of the always swap strategy.
+
+    Selects the first remaining door that is not the current selection,
+    as in `always_swap`.
+    """
+    indices = np.arange(remaining.shape[1])
+    return np.argmax(remaining & (indices != current[:, None]), axis=1)
+
+
+def _never_swap_vectorized(remaining, current):
+    """
+    Vectorized form of the never swap strategy.
+    """
+    return current
+
+
+always_swap.vectorized = _always_swap_vectorized
+never_swap.vectorized = _never_swap_vectorized
+
+# Compiled kernels for the standard strategies, each running a whole
+# batch of simulations with the strategy inlined.
+if numba is not None:
+    _KERNEL_REGISTRY = {
+        always_swap: _always_swap_kernel_nb,
+        never_swap: _never_swap_kernel_nb,
+    }
+else:
+    _KERNEL_REGISTRY = {}
+
+
 CLASSICAL_MONTY_HALL = MontyHallExperiment(number_of_doors=3)
@@ -15,5 +15,7 @@ setup(
     url="https://github.com/inakleinbottle/montyhall",
     long_description=LONG_DESCR,
     long_description_content_type="text/markdown",
+    install_requires=["numpy"],
+    extras_require={"numba": ["numba"], "loky": ["loky"]},
 
 )
@@ -0,0 +1,328 @@
+"""
+Tests for the Monty Hall simulations.
+
+The bit helpers of the compiled experiment are checked against brute
+force, and the different ways of running the simulations are checked
+to agree statistically with the Python experiment.
+"""
+import functools
+import math
+import pickle
+import random
+import unittest
+
+import numpy as np
+
+import montyhall
+from montyhall import MontyHallExperiment, always_swap, never_swap
+
+
+def set_bits(x):
+    """
+    Positions of the set bits of x, in increasing order.
+    """
+    return [i for i in range(64) if x >> i & 1]
+
+
+@unittest.skipIf(montyhall.numba is None, "numba is not installed")
+class TestBitHelpers(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(12345)
+        values = list(range(1, 1 << 12))
+        values += [rng.getrandbits(64) for _ in range(2000)]
+        # Sparse masks, like those left late in a game with many doors.
+        values += [sum(1 << b for b in rng.sample(range(64), k))
+                   for k in range(1, 9) for _ in range(200)]
+        values += [(1 << 64) - 1, 1 << 63, (1 << 63) | 1]
+        self.values = values
+
+    def test_popcount(self):
+        for x in self.values + [0]:
+            self.assertEqual(
+                montyhall._popcount_nb(np.uint64(x)), bin(x).count("1"), x
+            )
+
+    def test_lowest_bit(self):
+        for x in self.values:
+            self.assertEqual(
+                montyhall._lowest_bit_nb(np.uint64(x)), set_bits(x)[0], x
+            )
+
+    def test_select_bit(self):
+        for x in self.values:
+            for k, bit in enumerate(set_bits(x)):
+                self.assertEqual(
+                    montyhall._select_bit_nb(np.uint64(x), k), bit, (x, k)
+                )
+
+
+class ProportionTestCase(unittest.TestCase):
+
+    def assert_proportion(self, successes, number, p, reference_number=None):
+        """
+        Check the proportion of successes is close to p, which is exact
+        unless it was estimated from `reference_number` simulations.
+        """
+        variance = 1 / number
+        if reference_number is not None:
+            variance += 1 / reference_number
+        error = math.sqrt(p * (1 - p) * variance)
+        self.assertAlmostEqual(successes / number, p, delta=6 * error)
+
+
+class TestPathAgreement(ProportionTestCase):
+    """
+    Each way of running the simulations should agree with the Python
+    experiment, up to sampling error.
+    """
+
+    number = 50000
+
+    def assert_agree(self, successes, number, expected):
+        self.assert_proportion(
+            successes, number, expected / self.number, self.number
+        )
+
+    def python_successes(self, exp, strategy):
+        # Run the Python experiment directly, skipping the faster paths
+        # tried by run_simulations, and keep it in this process.
+        return exp._run_experiments(
+            strategy, self.number, None, montyhall._choice,
+            parallel_threshold=self.number + 1
+        )
+
+    def check_paths(self, number_of_doors):
+        exp = MontyHallExperiment(number_of_doors=number_of_doors)
+        for strategy in (always_swap, never_swap):
+            with self.subTest(strategy=strategy.__name__):
+                expected = self.python_successes(exp, strategy)
+                if strategy is never_swap:
+                    self.assert_proportion(
+                        expected, self.number, 1 / number_of_doors
+                    )
+                self.assert_agree(
+                    exp._run_vectorized(strategy, self.number), self.number,
+                    expected
+                )
+                if strategy in montyhall._KERNEL_REGISTRY:
+                    kernel = montyhall._KERNEL_REGISTRY[strategy]
+                    compiled_number = 10 * self.number
+                    self.assert_agree(
+                        kernel(exp._cum_weights, compiled_number),
+                        compiled_number, expected
+                    )
+                if number_of_doors == 3:
+                    self.assert_agree(
+                        exp._run_three_doors(strategy, self.number),
+                        self.number, expected
+                    )
+
+    def test_three_doors(self):
+        self.check_paths(3)
+
+    def test_four_doors(self):
+        self.check_paths(4)
+
+    def test_ten_doors(self):
+        self.check_paths(10)
+
+
+def most_likely(doors, past_selections):
+    """
+    Strategy that selects the remaining door with the highest
+    probability.
+    """
+    return max(doors, key=lambda d: d.probability)
+
+
+def labelled_doors(*probabilities):
+    return [montyhall.Door(p, label=label)
+            for p, label in zip(probabilities, "ABCD")]
+
+
+class TestPool(ProportionTestCase):
+    """
+    Simulations run in worker processes should agree with those run in
+    the current process.
+    """
+
+    number = 40000
+
+    def run_in_pool(self, exp):
+        return exp.run_simulations(most_likely, self.number,
+                                   parallel_threshold=0)
+
+    def run_in_process(self, exp):
+        return exp.run_simulations(most_likely, self.number,
+                                   parallel_threshold=self.number + 1)
+
+    def check_experiments_do_not_share_workers(self):
+        # The doors of these experiments compare equal, since they have
+        # the same labels, but carry different probabilities.
+        first = MontyHallExperiment(*labelled_doors(0.7, 0.1, 0.1, 0.1))
+        second = MontyHallExperiment(*labelled_doors(0.1, 0.1, 0.1, 0.7))
+        try:
+            self.run_in_pool(first)
+            expected = self.run_in_process(second)
+            self.assert_proportion(
+                self.run_in_pool(second) * self.number, self.number,
+                expected, self.number
+            )
+        finally:
+            first.close()
+            second.close()
+
+    @unittest.skipIf(montyhall.loky is None, "loky is not installed")
+    def test_loky_experiments_do_not_share_workers(self):
+        self.check_experiments_do_not_share_workers()
+
+    def test_pool_experiments_do_not_share_workers(self):
+        loky = montyhall.loky
+        montyhall.loky = None
+        try:
+            self.check_experiments_do_not_share_workers()
+        finally:
+            montyhall.loky = loky
+
+
+class TestExactProbability(unittest.TestCase):
+
+    def test_never_swap(self):
+        for number_of_doors in (3, 4, 10):
+            exp = MontyHallExperiment(number_of_doors=number_of_doors)
+            self.assertEqual(exp.exact_probability(never_swap),
+                             1 / number_of_doors)
+
+    def test_always_swap(self):
+        exp = MontyHallExperiment(number_of_doors=3)
+        self.assertAlmostEqual(exp.exact_probability(always_swap), 2 / 3)
+        exp = MontyHallExperiment(number_of_doors=4)
+        self.assertIsNone(exp.exact_probability(always_swap))
+
+    def test_custom_experiment(self):
+        exp = MontyHallExperiment(number_of_doors=3,
+                                  experiment=lambda *args: None)
+        self.assertIsNone(exp.exact_probability(never_swap))
+
+    def test_analytic(self):
+        exp = MontyHallExperiment(number_of_doors=3)
+        self.assertEqual(exp.run_simulations(never_swap, 100), 1 / 3)
+        # The proportion of 1000 simulations cannot be exactly 1/3.
+        simulated = exp.run_simulations(never_swap, 1000, analytic=False)
+        self.assertNotEqual(simulated, 1 / 3)
+        self.assertAlmostEqual(simulated, 1 / 3, delta=0.1)
+
+
+def custom_experiment(doors, strategy, choice_func, correct):
+    """
+    Custom experiment function that records the type of the correct
+    door it is given.
+    """
+    result = montyhall.experiment(doors, strategy, choice_func, correct)
+    return result._replace(success=isinstance(correct, montyhall.Door))
+
+
+
+class TestCustomExperiment(unittest.TestCase):
+    """
+    Custom experiment functions should be given the correct door as a
+    Door, wherever the simulations are run.
+    """
+
+    def setUp(self):
+        self.exp = MontyHallExperiment(number_of_doors=4,
+                                       experiment=custom_experiment)
+
+    def tearDown(self):
+        self.exp.close()
+
+    def test_in_process(self):
+        self.assertEqual(self.exp.run_simulations(always_swap, 100), 1.)
+
+    def test_in_pool(self):
+        self.assertEqual(
+            self.exp.run_simulations(always_swap, 100, parallel_threshold=0),
+            1.
+        )
+
+
+class TestDoorProbabilities(unittest.TestCase):
+
+    def test_remaining_probability_is_shared(self):
+        exp = MontyHallExperiment(
+            montyhall.Door(0.5), montyhall.Door(), montyhall.Door()
+        )
+        self.assertEqual([d.probability for d in exp.doors],
+                         [0.5, 0.25, 0.25])
+
+    def test_rounding_is_allowed(self):
+        # Probabilities such as 1/9 do not sum to exactly 1.
+        for number_of_doors in (3, 7, 9, 10, 11, 49):
+            with self.subTest(number_of_doors=number_of_doors):
+                MontyHallExperiment(number_of_doors=number_of_doors)
+                MontyHallExperiment(*(montyhall.Door(1 / number_of_doors)
+                                      for _ in range(number_of_doors)))
+
+    def test_rounding_does_not_give_negative_probability(self):
+        doors = [montyhall.Door(1 / 9) for _ in range(9)]
+        doors.append(montyhall.Door())
+        exp = MontyHallExperiment(*doors)
+        self.assertGreaterEqual(exp.doors[-1].probability, 0.)
+
+    def test_probabilities_summing_to_more_than_one(self):
+        with self.assertRaises(ValueError):
+            MontyHallExperiment(montyhall.Door(0.6), montyhall.Door(0.6))
+
+
+class TestStrategies(unittest.TestCase):
+
+    def test_partial_strategy(self):
+        # A partial of a top-level function can be sent to the workers.
+        strategy = functools.partial(most_likely)
+        exp = MontyHallExperiment(*labelled_doors(0.1, 0.1, 0.1, 0.7))
+        try:
+            for parallel_threshold in (0, 1001):
+                with self.subTest(parallel_threshold=parallel_threshold):
+                    self.assertAlmostEqual(
+                        exp.run_simulations(
+                            strategy, 1000,
+                            parallel_threshold=parallel_threshold),
+                        0.73, delta=0.1
+                    )
+        finally:
+            exp.close()
+
+
+class TestDoor(unittest.TestCase):
+
+    def test_equality(self):
+        a = montyhall.Door(0.5, label="A")
+        self.assertEqual(a, montyhall.Door(0.2, label="A"))
+        self.assertNotEqual(a, montyhall.Door(0.5, label="B"))
+        self.assertNotEqual(a, "A")
+
+    def test_hash(self):
+        doors = {montyhall.Door(label="A"), montyhall.Door(label="A"),
+                 montyhall.Door(label="B")}
+        self.assertEqual(len(doors), 2)
+        self.assertIn(montyhall.Door(label="B"), doors)
+
+    def test_pickle(self):
+        door = montyhall.Door(0.25, label="A")
+        copy = pickle.loads(pickle.dumps(door))
+        self.assertEqual(copy, door)
+        self.assertEqual(copy.probability, 0.25)
+
+
+class TestChoiceFunction(unittest.TestCase):
+
+    def test_random_choice_is_default(self):
+        exp = MontyHallExperiment(number_of_doors=4)
+        self.assertTrue(exp._uses_defaults(montyhall._choice))
+        self.assertTrue(exp._uses_defaults(random.choice))
+        self.assertFalse(exp._uses_defaults(random.Random().choice))
+
+
+if __name__ == "__main__":
+    unittest.main()